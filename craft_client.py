@@ -0,0 +1,259 @@
+"""
+Shared client pieces for the craft assistant examples
+
+langchain_mcp_example.py and langgraph_mcp_simple.py both connect to the
+craft_tool.py MCP server and to Ollama. The settings, system prompt and
+connection helpers they have in common live here.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    from mcp_use import MCPAgent, MCPClient
+except ImportError:
+    print("Error: mcp-use package not found. Install it with: uv add mcp-use")
+    exit(1)
+
+try:
+    from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+except ImportError:
+    print("Error: langchain-core package not found. Install it with: uv add langchain-core")
+    exit(1)
+
+try:
+    import httpx
+except ImportError:
+    print("Error: httpx package not found. Install it with: uv add httpx")
+    exit(1)
+
+logger = logging.getLogger(__name__)
+
+# MCP server configuration for our craft tool
+MCP_CONFIG = {
+    "mcpServers": {
+        "craft": {
+            "command": "uv",
+            "args": ["run", "python", "craft_tool.py"]
+        }
+    }
+}
+
+# Keep the model (and its prompt KV cache) loaded in Ollama between turns;
+# Ollama's default unloads it after 5 idle minutes
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Connection limits for the shared Ollama transport
+OLLAMA_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Answers kept by the response cache
+RESPONSE_CACHE_SIZE = 256
+
+# mcp-use reports a failed run as an answer starting with this text
+AGENT_STOPPED_PREFIX = "Agent stopped"
+
+# Questions that can lead the agent to get_random_craft, whose answer changes
+# from call to call; their answers are never cached
+NON_DETERMINISTIC_QUESTION_RE = re.compile(r"\b(random|surprise|suggest|pick)", re.IGNORECASE)
+
+# Cache key: model name, the conversation before the question as
+# (message type, content) pairs, and the question
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], str]
+
+# Demo questions sent to Ollama at the same time (Ollama's default
+# OLLAMA_NUM_PARALLEL is 4; extra requests would just queue server-side)
+DEMO_CONCURRENCY = 4
+
+# System prompt template for the craft agent. mcp-use fills in
+# {tool_descriptions} from the tools the server reports, so the list stays in
+# step with craft_tool.py. Keeping the rest fixed (no timestamps or
+# per-session values) lets Ollama reuse the cached prompt prefix; the user's
+# turn always comes last. The placeholder must be the only brace pair.
+CRAFT_SYSTEM_PROMPT_TEMPLATE = """You are a friendly craft assistant. Answer questions about craft projects
+using the craft tools below, and never invent crafts that the tools do not return.
+
+Available tools:
+{tool_descriptions}
+
+Use craft ids (e.g. 'paper_airplane') from list_craft_items when a tool needs an item_id.
+When you need several lookups at once (for example details for more than one craft),
+make a single batch_execute call with one entry per lookup, each giving the "tool" name
+and its "args", instead of calling the tools one by one."""
+
+# One MCP client (and craft_tool.py subprocess) shared by every assistant in
+# the process, so later sessions skip the server cold start
+_shared_client: Optional[MCPClient] = None
+_shared_client_lock = asyncio.Lock()
+
+# One HTTP connection pool to Ollama shared by every ChatOllama in the
+# process; each ChatOllama otherwise opens its own httpx client and pool
+_ollama_transport: Optional[httpx.AsyncHTTPTransport] = None
+_ollama_transport_lock = asyncio.Lock()
+
+
+def configure_logging():
+    """Log at WARNING by default; set LOG_LEVEL=INFO or DEBUG for more."""
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+
+
+async def get_shared_client() -> MCPClient:
+    """Return the process-wide MCP client, creating it on first use."""
+    global _shared_client
+    async with _shared_client_lock:
+        if _shared_client is None:
+            client = MCPClient.from_dict(MCP_CONFIG)
+            # Start the server session up front so agents initialized
+            # concurrently all reuse it instead of each spawning one
+            await client.create_all_sessions()
+            _shared_client = client
+        return _shared_client
+
+
+async def close_shared_client():
+    """Close the process-wide MCP client's sessions and the Ollama transport."""
+    global _shared_client
+    async with _shared_client_lock:
+        client, _shared_client = _shared_client, None
+    if client:
+        try:
+            await client.close_all_sessions()
+        except Exception as e:
+            logger.error("Cleanup error: %s", e)
+    await close_ollama_transport()
+
+
+async def get_ollama_transport() -> httpx.AsyncHTTPTransport:
+    """Return the process-wide Ollama HTTP transport, creating it on first use."""
+    global _ollama_transport
+    async with _ollama_transport_lock:
+        if _ollama_transport is None:
+            _ollama_transport = httpx.AsyncHTTPTransport(limits=OLLAMA_LIMITS)
+        return _ollama_transport
+
+
+async def close_ollama_transport():
+    """Close the process-wide Ollama HTTP transport, if it was created."""
+    global _ollama_transport
+    async with _ollama_transport_lock:
+        transport, _ollama_transport = _ollama_transport, None
+    if transport:
+        try:
+            await transport.aclose()
+        except Exception as e:
+            logger.error("Cleanup error: %s", e)
+
+
+class ResponseCache:
+    """LRU cache of agent answers, keyed by model, conversation so far and question."""
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._responses: "OrderedDict[CacheKey, str]" = OrderedDict()
+
+    @staticmethod
+    def key(model_name: str, agent: MCPAgent, user_input: str) -> Optional[CacheKey]:
+        """Return the cache key for asking the agent this question next.
+
+        Build the key before running the agent, since the run adds to its
+        memory. Returns None when the answer must not be cached.
+        """
+        if NON_DETERMINISTIC_QUESTION_RE.search(user_input):
+            return None
+        history: List[BaseMessage] = agent.get_conversation_history() if agent.memory_enabled else []
+        conversation = tuple((msg.type, str(msg.content)) for msg in history
+                             if isinstance(msg, (HumanMessage, AIMessage)))
+        return (model_name, conversation, user_input)
+
+    def get(self, key: Optional[CacheKey]) -> Optional[str]:
+        """Return the cached answer for this key, if there is one."""
+        if key is None:
+            return None
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+        return response
+
+    def put(self, key: Optional[CacheKey], response: str):
+        """Remember an answer, unless it is uncacheable or the agent run failed."""
+        if key is None or response.startswith(AGENT_STOPPED_PREFIX):
+            return
+        self._responses[key] = response
+        self._responses.move_to_end(key)
+        if len(self._responses) > self.maxsize:
+            self._responses.popitem(last=False)
+
+
+# Answers shared by every agent in the process, so a repeated question skips
+# the agent run and its Ollama round trips
+response_cache = ResponseCache()
+
+
+def record_cached_answer(agent: MCPAgent, user_input: str, response: str):
+    """Add a turn answered from the cache to the agent's memory, as a run would."""
+    agent.add_to_history(HumanMessage(content=user_input))
+    agent.add_to_history(AIMessage(content=response))
+
+
+class MCPClientPool:
+    """Round-robin pool of MCP clients, each with its own craft_tool.py server."""
+
+    def __init__(self, config: Dict[str, Any], size: int = DEMO_CONCURRENCY):
+        self.config = config
+        self.size = size
+        self.clients: List[MCPClient] = []
+        self._next_index = itertools.count()
+        self._lock = asyncio.Lock()
+
+    async def next(self) -> MCPClient:
+        """Return the next client, starting a new server until the pool is full."""
+        async with self._lock:
+            if len(self.clients) < self.size:
+                client = MCPClient.from_dict(self.config)
+                # Start the server session up front so agents initialized
+                # later reuse it instead of each spawning one
+                await client.create_all_sessions()
+                self.clients.append(client)
+                return client
+            return self.clients[next(self._next_index) % self.size]
+
+    async def close_all_sessions(self):
+        """Close the sessions of every client in the pool and the Ollama transport."""
+        async with self._lock:
+            clients, self.clients = self.clients, []
+        # Close in reverse start order: each session's anyio cancel scope was
+        # entered on top of the previous one's and must be exited LIFO
+        for client in reversed(clients):
+            try:
+                await client.close_all_sessions()
+            except Exception as e:
+                logger.error("Cleanup error: %s", e)
+        await close_ollama_transport()
+
+
+async def ainput(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(set_outcome, value):
+        if not future.done():
+            set_outcome(value)
+
+    def read_line():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(settle, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(settle, future.set_result, line)
+
+    # A daemon thread (rather than the default executor) so a pending read
+    # does not hold up interpreter exit after Ctrl+C
+    threading.Thread(target=read_line, daemon=True).start()
+    return await future
@@ -2,53 +2,126 @@
 A simple craft tool for LLM using FastMCP library.
 
 This module provides craft-related tools and utilities for language model interactions.
+
+Logging is disabled by default. Set the CRAFT_TOOL_LOG environment variable
+(e.g. CRAFT_TOOL_LOG=1) to write INFO-level logs to craft_tool_server.log
+and stderr; an empty value, 0, false or no leaves logging off.
 """
 
 from fastmcp import FastMCP
-from pydantic import BaseModel
-from typing import List, Dict, Optional
-import json
-import random
+import orjson
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Tuple, Union
+from random import randrange
+from types import MappingProxyType
+import re
+import atexit
 import logging
+import os
+import queue
+import threading
 import sys
-import traceback
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('craft_tool_server.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FLUSH_INTERVAL = 30.0  # seconds
+
+# Logging is off unless CRAFT_TOOL_LOG is set; the NullHandler keeps
+# warnings from falling through to logging's last-resort stderr handler.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def _flush_log_buffer(buffer_handler: MemoryHandler) -> None:
+    """Flush buffered file log records and schedule the next periodic flush."""
+    buffer_handler.flush()
+    timer = threading.Timer(
+        LOG_FLUSH_INTERVAL, _flush_log_buffer, args=(buffer_handler,))
+    timer.daemon = True
+    timer.start()
+
+
+def _configure_logging() -> None:
+    """Attach the buffered file and console log handlers to the root logger."""
+    # Buffer file log records and write them in batches instead of once per
+    # record. Errors flush the buffer immediately, a timer flushes it every
+    # LOG_FLUSH_INTERVAL seconds, and logging.shutdown() flushes it at exit.
+    file_handler = logging.FileHandler('craft_tool_server.log')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    buffer_handler = MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    # stdout carries the MCP stdio transport, so console logs go to stderr
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # Tool calls only enqueue records; a background listener thread owns the
+    # output handlers, so formatting and I/O happen off the request path.
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    # The queue handler only merges the message arguments; the listener's
+    # handlers apply LOG_FORMAT.
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    listener = QueueListener(
+        log_queue,
+        buffer_handler,
+        stream_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[queue_handler]
+    )
+    _flush_log_buffer(buffer_handler)
+
+
+if os.environ.get("CRAFT_TOOL_LOG", "").strip().lower() not in ("", "0", "false", "no"):
+    _configure_logging()
+
+
+def _serialize_tool_result(data) -> str:
+    """Serialize a tool result to JSON text for the MCP response.
+
+    Args:
+        data: The value returned by a tool function
+    """
+    return orjson.dumps(data).decode()
+
 
 # Log server startup
 logger.info("Starting Craft Tool Server initialization...")
 
 try:
     # Initialize FastMCP server
-    mcp = FastMCP("Craft Tool Server")
+    mcp = FastMCP("Craft Tool Server", tool_serializer=_serialize_tool_result)
     logger.info("FastMCP server initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize FastMCP server: {e}")
-    logger.error(f"Traceback: {traceback.format_exc()}")
+except Exception:
+    logger.exception("Failed to initialize FastMCP server")
     sys.exit(1)
 
 
-class CraftItem(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CraftItem:
     """Represents a craft item with its properties."""
     name: str
     description: str
-    materials: List[str]
+    materials: Tuple[str, ...]
     difficulty: str  # "easy", "medium", "hard"
     time_required: str
     category: str
 
 
-class CraftRecipe(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CraftRecipe:
     """Represents a complete crafting recipe."""
     item: CraftItem
     instructions: List[str]
@@ -60,7 +133,7 @@ CRAFT_DATABASE = {
     "paper_airplane": CraftItem(
         name="Paper Airplane",
         description="A simple flying paper craft perfect for beginners",
-        materials=["A4 paper", "steady hands"],
+        materials=("A4 paper", "steady hands"),
         difficulty="easy",
         time_required="5 minutes",
         category="paper_crafts"
@@ -68,7 +141,7 @@ CRAFT_DATABASE = {
     "origami_crane": CraftItem(
         name="Origami Crane",
         description="Traditional Japanese paper folding creating an elegant crane",
-        materials=["Square origami paper"],
+        materials=("Square origami paper",),
         difficulty="medium",
         time_required="15-20 minutes",
         category="origami"
@@ -76,7 +149,7 @@ CRAFT_DATABASE = {
     "friendship_bracelet": CraftItem(
         name="Friendship Bracelet",
         description="Colorful woven bracelet made with embroidery thread",
-        materials=["Embroidery thread (3-4 colors)", "scissors", "tape"],
+        materials=("Embroidery thread (3-4 colors)", "scissors", "tape"),
         difficulty="medium",
         time_required="30-45 minutes",
         category="jewelry"
@@ -84,7 +157,7 @@ CRAFT_DATABASE = {
     "painted_rock": CraftItem(
         name="Painted Rock",
         description="Decorative rock painted with creative designs",
-        materials=["Smooth rock", "acrylic paints", "paintbrushes", "sealant"],
+        materials=("Smooth rock", "acrylic paints", "paintbrushes", "sealant"),
         difficulty="easy",
         time_required="1-2 hours (including drying time)",
         category="painting"
@@ -92,7 +165,7 @@ CRAFT_DATABASE = {
     "macrame_plant_hanger": CraftItem(
         name="Macrame Plant Hanger",
         description="Elegant plant hanger made with knotted cord",
-        materials=["Macrame cord", "metal ring", "scissors", "measuring tape"],
+        materials=("Macrame cord", "metal ring", "scissors", "measuring tape"),
         difficulty="hard",
         time_required="2-3 hours",
         category="home_decor"
@@ -182,6 +255,171 @@ CRAFT_TIPS = {
     ]
 }
 
+# The craft data is static; expose read-only views so shared responses
+# built from it can be handed out without defensive copies
+CRAFT_DATABASE = MappingProxyType(CRAFT_DATABASE)
+CRAFT_INSTRUCTIONS = MappingProxyType(CRAFT_INSTRUCTIONS)
+CRAFT_TIPS = MappingProxyType(CRAFT_TIPS)
+
+_VALID_DIFFICULTIES = frozenset({'easy', 'medium', 'hard'})
+_NUMBER_RE = re.compile(r'\d+')
+
+
+def _parse_minutes(time_required: str) -> int:
+    """Convert a time_required string to minutes using its first number.
+
+    Args:
+        time_required: Human readable duration such as "15-20 minutes" or "2-3 hours"
+    """
+    # Simple time parsing (this is a basic implementation)
+    time_str = time_required.lower()
+    match = _NUMBER_RE.search(time_str)
+    if not match:
+        return 0
+    if "minute" in time_str:
+        # Take first number as minutes
+        return int(match.group())
+    if "hour" in time_str:
+        # Convert hours to minutes
+        return int(match.group()) * 60
+    return 0
+
+
+# Precomputed responses (CRAFT_DATABASE is static, so these are built once at
+# import). They are stored as immutable JSON bytes and each call decodes its own
+# copy, so a caller that mutates a result cannot change later responses.
+_CRAFT_ITEM_LIST_JSON = orjson.dumps([
+    {
+        "id": item_id,
+        "name": item.name,
+        "description": item.description,
+        "difficulty": item.difficulty,
+        "time_required": item.time_required,
+        "category": item.category
+    }
+    for item_id, item in CRAFT_DATABASE.items()
+])
+
+_CRAFT_DETAILS_JSON = {
+    item_id: orjson.dumps({
+        # Responses keep materials as a list, matching the other list fields
+        "item": {**asdict(item), "materials": list(item.materials)},
+        "instructions": list(CRAFT_INSTRUCTIONS.get(item_id, ())),
+        "tips": list(CRAFT_TIPS.get(item_id, ()))
+    })
+    for item_id, item in CRAFT_DATABASE.items()
+}
+
+_ITEM_MINUTES = {
+    item_id: _parse_minutes(item.time_required)
+    for item_id, item in CRAFT_DATABASE.items()
+}
+# Read-only views; estimate_craft_time copies the rows it returns
+_TIME_ESTIMATE_ROWS = {
+    item_id: MappingProxyType({
+        "id": item_id,
+        "name": item.name,
+        "time": item.time_required
+    })
+    for item_id, item in CRAFT_DATABASE.items()
+}
+
+# Search columns laid out as parallel tuples in CRAFT_DATABASE order, so the
+# search loops walk plain tuples instead of reading model attributes.
+# Category, difficulty and material strings are lowercased here once and
+# interned, so an interned query matches them by identity.
+_CRAFT_IDS = tuple(CRAFT_DATABASE.keys())
+# Unique categories in database order, for log messages
+_AVAILABLE_CATEGORIES = tuple(
+    dict.fromkeys(item.category for item in CRAFT_DATABASE.values())
+)
+_CRAFT_CATEGORIES_LOWER = tuple(
+    sys.intern(item.category.lower()) for item in CRAFT_DATABASE.values()
+)
+_CRAFT_DIFFICULTIES_LOWER = tuple(
+    sys.intern(item.difficulty.lower()) for item in CRAFT_DATABASE.values()
+)
+
+# Result rows for each search, aligned with _CRAFT_IDS
+_CATEGORY_SEARCH_ROWS = tuple(
+    {
+        "id": item_id,
+        "name": item.name,
+        "description": item.description,
+        "difficulty": item.difficulty,
+        "time_required": item.time_required
+    }
+    for item_id, item in CRAFT_DATABASE.items()
+)
+_DIFFICULTY_SEARCH_ROWS = tuple(
+    {
+        "id": item_id,
+        "name": item.name,
+        "description": item.description,
+        "category": item.category,
+        "time_required": item.time_required
+    }
+    for item_id, item in CRAFT_DATABASE.items()
+)
+_MATERIAL_SEARCH_ROWS = tuple(
+    {
+        "id": item_id,
+        "name": item.name,
+        "description": item.description,
+        "materials_needed": list(item.materials),
+        "difficulty": item.difficulty,
+        "time_required": item.time_required
+    }
+    for item_id, item in CRAFT_DATABASE.items()
+)
+
+
+def _group_rows_json(keys: Tuple[str, ...], rows: Tuple[Dict, ...]) -> Dict[str, bytes]:
+    """Group search rows by key and store each group as JSON bytes.
+
+    Args:
+        keys: Lowercased value for each row, aligned with rows
+        rows: Result rows in CRAFT_DATABASE order
+    """
+    grouped: Dict[str, list] = defaultdict(list)
+    for key, row in zip(keys, rows):
+        grouped[key].append(row)
+    return {key: orjson.dumps(group) for key, group in grouped.items()}
+
+
+def _build_material_index() -> Dict[str, set]:
+    """Map every substring of a lowercased material to the crafts that use it.
+
+    Material names are short, so indexing all substrings keeps the existing
+    "query is contained in material" matching while turning each query
+    material into a single dict lookup. Crafts are given by their position
+    in CRAFT_DATABASE.
+    """
+    index: Dict[str, set] = defaultdict(set)
+    for position, item in enumerate(CRAFT_DATABASE.values()):
+        for material in item.materials:
+            material = material.lower().strip()
+            for start in range(len(material)):
+                for end in range(start + 1, len(material) + 1):
+                    index[sys.intern(material[start:end])].add(position)
+    return dict(index)
+
+
+# Category and difficulty search results as JSON bytes, keyed by the
+# lowercased value
+_BY_CATEGORY = _group_rows_json(_CRAFT_CATEGORIES_LOWER, _CATEGORY_SEARCH_ROWS)
+_BY_DIFFICULTY = _group_rows_json(_CRAFT_DIFFICULTIES_LOWER, _DIFFICULTY_SEARCH_ROWS)
+
+# Inverted index from material substrings to craft positions
+_MATERIAL_INDEX = _build_material_index()
+
+# Searches lowercase only the query, so every index key must already be lowercase
+assert all(
+    key == key.lower()
+    for index in (_BY_CATEGORY, _BY_DIFFICULTY, _MATERIAL_INDEX)
+    for key in index
+), "search index keys must be lowercase"
+
 # Core functions (not decorated for direct testing)
 
 
@@ -189,22 +427,11 @@ def _list_craft_items() -> List[Dict]:
     """List all available craft items with their basic information."""
     try:
         logger.debug("Listing all craft items")
-        result = [
-            {
-                "id": item_id,
-                "name": item.name,
-                "description": item.description,
-                "difficulty": item.difficulty,
-                "time_required": item.time_required,
-                "category": item.category
-            }
-            for item_id, item in CRAFT_DATABASE.items()
-        ]
-        logger.info(f"Successfully listed {len(result)} craft items")
+        result = orjson.loads(_CRAFT_ITEM_LIST_JSON)
+        logger.info("Successfully listed %d craft items", len(result))
         return result
     except Exception as e:
-        logger.error(f"Error listing craft items: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error listing craft items")
         return {"error": f"Failed to list craft items: {str(e)}"}
 
 
@@ -215,7 +442,7 @@ def _get_craft_details(item_id: str) -> Dict:
         item_id: The ID of the craft item to retrieve details for
     """
     try:
-        logger.debug(f"Getting craft details for item_id: {item_id}")
+        logger.debug("Getting craft details for item_id: %s", item_id)
 
         if not item_id:
             logger.warning("Empty item_id provided to get_craft_details")
@@ -223,20 +450,15 @@ def _get_craft_details(item_id: str) -> Dict:
 
         if item_id not in CRAFT_DATABASE:
             logger.warning(
-                f"Craft item '{item_id}' not found in database. Available items: {list(CRAFT_DATABASE.keys())}")
+                "Craft item '%s' not found in database. Available items: %s",
+                item_id, _CRAFT_IDS)
             return {"error": f"Craft item '{item_id}' not found"}
 
-        item = CRAFT_DATABASE[item_id]
-        result = {
-            "item": item.model_dump(),
-            "instructions": CRAFT_INSTRUCTIONS.get(item_id, []),
-            "tips": CRAFT_TIPS.get(item_id, [])
-        }
-        logger.info(f"Successfully retrieved craft details for '{item_id}'")
+        result = orjson.loads(_CRAFT_DETAILS_JSON[item_id])
+        logger.info("Successfully retrieved craft details for '%s'", item_id)
         return result
     except Exception as e:
-        logger.error(f"Error getting craft details for '{item_id}': {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error getting craft details for '%s'", item_id)
         return {"error": f"Failed to get craft details: {str(e)}"}
 
 
@@ -247,34 +469,23 @@ def _search_crafts_by_category(category: str) -> List[Dict]:
         category: The category to search for (e.g., 'paper_crafts', 'origami', 'jewelry')
     """
     try:
-        logger.debug(f"Searching crafts by category: {category}")
+        logger.debug("Searching crafts by category: %s", category)
 
         if not category:
             logger.warning(
                 "Empty category provided to search_crafts_by_category")
             return {"error": "Category cannot be empty"}
 
-        results = []
-        for item_id, item in CRAFT_DATABASE.items():
-            if item.category.lower() == category.lower():
-                results.append({
-                    "id": item_id,
-                    "name": item.name,
-                    "description": item.description,
-                    "difficulty": item.difficulty,
-                    "time_required": item.time_required
-                })
-
-        logger.info(f"Found {len(results)} crafts in category '{category}'")
+        category_lower = sys.intern(category.lower())
+        results = orjson.loads(_BY_CATEGORY.get(category_lower, b"[]"))
+
+        logger.info("Found %d crafts in category '%s'", len(results), category)
         if len(results) == 0:
-            available_categories = list(
-                set(item.category for item in CRAFT_DATABASE.values()))
-            logger.info(f"Available categories: {available_categories}")
+            logger.info("Available categories: %s", _AVAILABLE_CATEGORIES)
 
         return results
     except Exception as e:
-        logger.error(f"Error searching crafts by category '{category}': {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error searching crafts by category '%s'", category)
         return {"error": f"Failed to search by category: {str(e)}"}
 
 
@@ -285,36 +496,28 @@ def _search_crafts_by_difficulty(difficulty: str) -> List[Dict]:
         difficulty: The difficulty level ('easy', 'medium', 'hard')
     """
     try:
-        logger.debug(f"Searching crafts by difficulty: {difficulty}")
+        logger.debug("Searching crafts by difficulty: %s", difficulty)
 
         if not difficulty:
             logger.warning(
                 "Empty difficulty provided to search_crafts_by_difficulty")
             return {"error": "Difficulty cannot be empty"}
 
-        if difficulty.lower() not in ['easy', 'medium', 'hard']:
+        difficulty_lower = sys.intern(difficulty.lower())
+        if difficulty_lower not in _VALID_DIFFICULTIES:
             logger.warning(
-                f"Invalid difficulty level '{difficulty}'. Valid levels: easy, medium, hard")
+                "Invalid difficulty level '%s'. Valid levels: easy, medium, hard",
+                difficulty)
             return {"error": "Difficulty must be 'easy', 'medium', or 'hard'"}
 
-        results = []
-        for item_id, item in CRAFT_DATABASE.items():
-            if item.difficulty.lower() == difficulty.lower():
-                results.append({
-                    "id": item_id,
-                    "name": item.name,
-                    "description": item.description,
-                    "category": item.category,
-                    "time_required": item.time_required
-                })
+        results = orjson.loads(_BY_DIFFICULTY.get(difficulty_lower, b"[]"))
 
         logger.info(
-            f"Found {len(results)} crafts with difficulty '{difficulty}'")
+            "Found %d crafts with difficulty '%s'", len(results), difficulty)
         return results
     except Exception as e:
-        logger.error(
-            f"Error searching crafts by difficulty '{difficulty}': {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(
+            "Error searching crafts by difficulty '%s'", difficulty)
         return {"error": f"Failed to search by difficulty: {str(e)}"}
 
 
@@ -327,15 +530,35 @@ def _get_random_craft() -> Dict:
             logger.error("CRAFT_DATABASE is empty, cannot get random craft")
             return {"error": "No crafts available in database"}
 
-        item_id = random.choice(list(CRAFT_DATABASE.keys()))
-        logger.info(f"Selected random craft: {item_id}")
+        item_id = _CRAFT_IDS[randrange(len(_CRAFT_IDS))]
+        logger.info("Selected random craft: %s", item_id)
         return _get_craft_details(item_id)
     except Exception as e:
-        logger.error(f"Error getting random craft: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error getting random craft")
         return {"error": f"Failed to get random craft: {str(e)}"}
 
 
+@lru_cache(maxsize=256)
+def _match_materials(materials_lower: frozenset) -> bytes:
+    """Return the search rows for crafts that use any of the given materials as JSON.
+
+    Args:
+        materials_lower: Normalized (lowercased, stripped) query materials
+    """
+    # Collect every craft that uses a material containing any query material,
+    # stopping early once every craft has matched
+    matched = set()
+    for available in materials_lower:
+        matched.update(_MATERIAL_INDEX.get(available, ()))
+        if len(matched) == len(_CRAFT_IDS):
+            break
+
+    # Positions follow database order, so sorting keeps the original result order.
+    # Cached as immutable bytes; callers decode their own copy.
+    return orjson.dumps(
+        [_MATERIAL_SEARCH_ROWS[position] for position in sorted(matched)])
+
+
 def _search_crafts_by_materials(materials: List[str]) -> List[Dict]:
     """Find crafts that can be made with available materials.
 
@@ -343,39 +566,29 @@ def _search_crafts_by_materials(materials: List[str]) -> List[Dict]:
         materials: List of materials you have available
     """
     try:
-        logger.debug(f"Searching crafts by materials: {materials}")
+        logger.debug("Searching crafts by materials: %r", materials)
 
         if not materials or len(materials) == 0:
             logger.warning(
                 "Empty materials list provided to search_crafts_by_materials")
             return []
 
-        results = []
-        materials_lower = [m.lower().strip() for m in materials if m.strip()]
+        # A frozenset drops repeated query materials and makes the query order
+        # irrelevant, so equivalent queries share one cache entry
+        materials_lower = frozenset(
+            m.lower().strip() for m in materials if m.strip())
 
         if not materials_lower:
             logger.warning("No valid materials found after processing")
             return []
 
-        for item_id, item in CRAFT_DATABASE.items():
-            # Check if any of the craft materials match the available materials
-            item_materials_lower = [m.lower().strip() for m in item.materials]
-            if any(available in item_mat for available in materials_lower for item_mat in item_materials_lower):
-                results.append({
-                    "id": item_id,
-                    "name": item.name,
-                    "description": item.description,
-                    "materials_needed": item.materials,
-                    "difficulty": item.difficulty,
-                    "time_required": item.time_required
-                })
+        results = orjson.loads(_match_materials(materials_lower))
 
         logger.info(
-            f"Found {len(results)} crafts matching available materials")
+            "Found %d crafts matching available materials", len(results))
         return results
-    except Exception as e:
-        logger.error(f"Error searching crafts by materials {materials}: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("Error searching crafts by materials %s", materials)
         return []
 
 
@@ -386,47 +599,27 @@ def _estimate_craft_time(item_ids: List[str]) -> Dict:
         item_ids: List of craft item IDs to estimate time for
     """
     try:
-        logger.debug(f"Estimating craft time for items: {item_ids}")
+        logger.debug("Estimating craft time for items: %r", item_ids)
 
         if not item_ids or len(item_ids) == 0:
             logger.warning(
                 "Empty item_ids list provided to estimate_craft_time")
             return {"error": "Item IDs list cannot be empty"}
 
-        total_time = 0
         valid_items = []
         invalid_items = []
+        total_time = 0
 
+        # Single pass: one lookup per id, using the minutes pre-parsed at import
         for item_id in item_ids:
-            if item_id in CRAFT_DATABASE:
-                item = CRAFT_DATABASE[item_id]
-                valid_items.append({
-                    "id": item_id,
-                    "name": item.name,
-                    "time": item.time_required
-                })
-                # Simple time parsing (this is a basic implementation)
-                time_str = item.time_required.lower()
-                try:
-                    if "minute" in time_str:
-                        # Extract numbers from time string
-                        import re
-                        numbers = re.findall(r'\d+', time_str)
-                        if numbers:
-                            # Take first number as minutes
-                            total_time += int(numbers[0])
-                    elif "hour" in time_str:
-                        numbers = re.findall(r'\d+', time_str)
-                        if numbers:
-                            # Convert hours to minutes
-                            total_time += int(numbers[0]) * 60
-                except Exception as parse_error:
-                    logger.warning(
-                        f"Failed to parse time for {item_id}: {parse_error}")
-            else:
+            row = _TIME_ESTIMATE_ROWS.get(item_id)
+            if row is None:
                 invalid_items.append(item_id)
                 logger.warning(
-                    f"Invalid item_id '{item_id}' in time estimation")
+                    "Invalid item_id '%s' in time estimation", item_id)
+            else:
+                valid_items.append(dict(row))
+                total_time += _ITEM_MINUTES[item_id]
 
         result = {
             "valid_items": valid_items,
@@ -436,99 +629,131 @@ def _estimate_craft_time(item_ids: List[str]) -> Dict:
         }
 
         logger.info(
-            f"Time estimation complete: {len(valid_items)} valid, {len(invalid_items)} invalid items")
+            "Time estimation complete: %d valid, %d invalid items",
+            len(valid_items), len(invalid_items))
         return result
     except Exception as e:
-        logger.error(f"Error estimating craft time for {item_ids}: {e}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Error estimating craft time for %s", item_ids)
         return {"error": f"Failed to estimate craft time: {str(e)}"}
 
-# MCP tool wrappers
 
+# Core functions that batch_execute can dispatch to, by tool name
+_TOOL_TABLE = {
+    "list_craft_items": _list_craft_items,
+    "get_craft_details": _get_craft_details,
+    "search_crafts_by_category": _search_crafts_by_category,
+    "search_crafts_by_difficulty": _search_crafts_by_difficulty,
+    "get_random_craft": _get_random_craft,
+    "search_crafts_by_materials": _search_crafts_by_materials,
+    "estimate_craft_time": _estimate_craft_time
+}
 
-@mcp.tool()
-def list_craft_items() -> List[Dict]:
-    """List all available craft items with their basic information."""
-    logger.info("MCP tool called: list_craft_items")
-    return _list_craft_items()
+# Argument types each tool accepts when called through batch_execute. List
+# arguments must hold strings only.
+_TOOL_ARG_TYPES = {
+    "list_craft_items": {},
+    "get_craft_details": {"item_id": str},
+    "search_crafts_by_category": {"category": str},
+    "search_crafts_by_difficulty": {"difficulty": str},
+    "get_random_craft": {},
+    "search_crafts_by_materials": {"materials": list},
+    "estimate_craft_time": {"item_ids": list}
+}
 
 
-@mcp.tool()
-def get_craft_details(item_id: str) -> Dict:
-    """Get detailed information about a specific craft item.
+def _check_tool_args(tool_name: str, args) -> Optional[str]:
+    """Return why args cannot be passed to a batched tool, or None if they can.
 
     Args:
-        item_id: The ID of the craft item to retrieve details for
+        tool_name: Name of a tool in _TOOL_TABLE
+        args: The "args" value of a batch call
     """
-    logger.info(f"MCP tool called: get_craft_details with item_id='{item_id}'")
-    return _get_craft_details(item_id)
-
+    if not isinstance(args, dict):
+        return "args must be an object"
 
-@mcp.tool()
-def search_crafts_by_category(category: str) -> List[Dict]:
-    """Search for craft items by category.
-
-    Args:
-        category: The category to search for (e.g., 'paper_crafts', 'origami', 'jewelry')
-    """
-    logger.info(
-        f"MCP tool called: search_crafts_by_category with category='{category}'")
-    return _search_crafts_by_category(category)
+    arg_types = _TOOL_ARG_TYPES[tool_name]
+    for name, value in args.items():
+        expected = arg_types.get(name)
+        if expected is None:
+            return f"unexpected argument '{name}'"
+        if not isinstance(value, expected):
+            return f"'{name}' must be a {expected.__name__}"
+        if expected is list and not all(isinstance(v, str) for v in value):
+            return f"'{name}' must be a list of strings"
+    return None
 
 
-@mcp.tool()
-def search_crafts_by_difficulty(difficulty: str) -> List[Dict]:
-    """Search for craft items by difficulty level.
+def _batch_execute(calls: List[Dict], stop_on_error: bool = False) -> Union[List[Dict], Dict]:
+    """Run several craft tool calls in a single request.
 
     Args:
-        difficulty: The difficulty level ('easy', 'medium', 'hard')
+        calls: List of calls, each like {"tool": "get_craft_details", "args": {"item_id": "origami_crane"}}
+        stop_on_error: Stop at the first call that returns an error instead of running the rest
     """
-    logger.info(
-        f"MCP tool called: search_crafts_by_difficulty with difficulty='{difficulty}'")
-    return _search_crafts_by_difficulty(difficulty)
-
+    try:
+        logger.debug("Running batch of %d tool calls", len(calls))
 
-@mcp.tool()
-def get_random_craft() -> Dict:
-    """Get a random craft suggestion for inspiration."""
-    logger.info("MCP tool called: get_random_craft")
-    return _get_random_craft()
+        if not calls:
+            logger.warning("Empty calls list provided to batch_execute")
+            return {"error": "Calls list cannot be empty"}
 
+        results = []
+        for call in calls:
+            tool_name = call.get("tool") if isinstance(call, dict) else None
+            tool_fn = _TOOL_TABLE.get(tool_name)
+            if tool_fn is None:
+                logger.warning("Unknown tool '%s' in batch_execute", tool_name)
+                result = {"error": f"Unknown tool '{tool_name}'"}
+            else:
+                args = call.get("args", {})
+                problem = _check_tool_args(tool_name, args)
+                if problem is None:
+                    try:
+                        result = tool_fn(**args)
+                    except TypeError as e:
+                        problem = str(e)
+                if problem is not None:
+                    logger.warning(
+                        "Invalid arguments for '%s' in batch_execute: %s", tool_name, problem)
+                    result = {"error": f"Invalid arguments for '{tool_name}': {problem}"}
 
-@mcp.tool()
-def search_crafts_by_materials(materials: List[str]) -> List[Dict]:
-    """Find crafts that can be made with available materials.
+            results.append({"tool": tool_name, "result": result})
+            if stop_on_error and isinstance(result, dict) and "error" in result:
+                break
 
-    Args:
-        materials: List of materials you have available
-    """
-    logger.info(
-        f"MCP tool called: search_crafts_by_materials with materials={materials}")
-    return _search_crafts_by_materials(materials)
+        logger.info("Batch complete: %d of %d calls run", len(results), len(calls))
+        return results
+    except Exception as e:
+        logger.exception("Error running batch of tool calls")
+        return {"error": f"Failed to run batch: {str(e)}"}
 
 
-@mcp.tool()
-def estimate_craft_time(item_ids: List[str]) -> Dict:
-    """Estimate total time needed for multiple crafts.
+# MCP tool registrations. The core functions are registered directly under
+# their public names, so a tool call does not go through an extra wrapper frame.
 
-    Args:
-        item_ids: List of craft item IDs to estimate time for
-    """
-    logger.info(
-        f"MCP tool called: estimate_craft_time with item_ids={item_ids}")
-    return _estimate_craft_time(item_ids)
+list_craft_items = mcp.tool(_list_craft_items, name="list_craft_items")
+get_craft_details = mcp.tool(_get_craft_details, name="get_craft_details")
+search_crafts_by_category = mcp.tool(
+    _search_crafts_by_category, name="search_crafts_by_category")
+search_crafts_by_difficulty = mcp.tool(
+    _search_crafts_by_difficulty, name="search_crafts_by_difficulty")
+get_random_craft = mcp.tool(_get_random_craft, name="get_random_craft")
+search_crafts_by_materials = mcp.tool(
+    _search_crafts_by_materials, name="search_crafts_by_materials")
+estimate_craft_time = mcp.tool(_estimate_craft_time, name="estimate_craft_time")
+batch_execute = mcp.tool(_batch_execute, name="batch_execute")
 
 
 if __name__ == "__main__":
     try:
         logger.info("Starting MCP server...")
-        logger.info(f"Server start time: {datetime.now()}")
+        logger.info("Server start time: %s", datetime.now())
         logger.info("MCP tools registered successfully")
 
         # Log available craft data for debugging
-        logger.info(f"Craft database loaded with {len(CRAFT_DATABASE)} items")
+        logger.info("Craft database loaded with %d items", len(CRAFT_DATABASE))
         logger.info(
-            f"Available craft categories: {list(set(item.category for item in CRAFT_DATABASE.values()))}")
+            "Available craft categories: %s", _AVAILABLE_CATEGORIES)
 
         # Run the MCP server
         logger.info("Running MCP server with stdio transport...")
@@ -538,9 +763,8 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server shutdown requested by user (Ctrl+C)")
     except Exception as e:
-        logger.error(f"Fatal error starting MCP server: {e}")
-        logger.error(f"Error type: {type(e).__name__}")
-        logger.error(f"Full traceback: {traceback.format_exc()}")
+        logger.exception(
+            "Fatal error starting MCP server (%s)", type(e).__name__)
         logger.error(
             "ROOT CAUSE: Server failed to start - check FastMCP installation and transport configuration")
         sys.exit(1)
@@ -15,23 +15,38 @@ from craft_tool import (
     _search_crafts_by_materials,
     _estimate_craft_time
 )
-import json
+from contextlib import redirect_stdout
+import io
+import sys
+
+import orjson
+
+_RULE = '=' * 60
 
 
 def print_section(title):
     """Print a formatted section header."""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print('='*60)
+    print(f"\n{_RULE}\n  {title}\n{_RULE}")
 
 
 def print_json(data, indent=2):
-    """Pretty print JSON data."""
-    print(json.dumps(data, indent=indent))
+    """Pretty print JSON data (orjson only supports a 2-space indent)."""
+    option = orjson.OPT_INDENT_2 if indent else 0
+    print(orjson.dumps(data, option=option).decode())
 
 
 def main():
     """Demonstrate the craft tool functionality."""
+    # Collect the whole demo output and write it to stdout in one go
+    out = io.StringIO()
+    with redirect_stdout(out):
+        _run_demo()
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+
+
+def _run_demo():
+    """Print each demo section (stdout is buffered by main())."""
     
     print("🎨 Welcome to the Craft Tool Demo!")
     print("This demo showcases the various features of our craft discovery tool.")
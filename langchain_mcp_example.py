@@ -13,10 +13,7 @@ This example shows proper MCP client integration using the mcp-use library.
 """
 
 import asyncio
-import json
 import logging
-import os
-from typing import Dict, Any
 
 try:
     from mcp_use import MCPAgent, MCPClient
@@ -30,23 +27,46 @@ except ImportError:
     print("Error: langchain-ollama package not found. Install it with: uv add langchain-ollama")
     exit(1)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    # Optional faster event loop (not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from craft_client import (
+    CRAFT_SYSTEM_PROMPT_TEMPLATE,
+    DEMO_CONCURRENCY,
+    MCP_CONFIG,
+    OLLAMA_KEEP_ALIVE,
+    ainput,
+    close_shared_client,
+    configure_logging,
+    get_ollama_transport,
+    get_shared_client,
+    record_cached_answer,
+    response_cache,
+)
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
 class CraftAssistant:
     """AI Assistant that uses MCP craft tools via mcp-use with LangChain and Ollama."""
 
-    def __init__(self, model_name: str = "llama3.2"):
+    def __init__(self, model_name: str = "llama3.2", shared_client: bool = True):
         """
         Initialize the craft assistant.
 
         Args:
             model_name: Name of the Ollama model to use
+            shared_client: Reuse the process-wide MCP client instead of
+                starting a dedicated craft_tool.py server
         """
         self.model_name = model_name
+        self.shared_client = shared_client
         self.client = None
+        self._owns_client = False
         self.agent = None
 
     async def setup(self) -> bool:
@@ -59,27 +79,28 @@ class CraftAssistant:
         try:
             logger.info("Setting up MCP client and agent...")
 
-            # Create MCP server configuration for our craft tool
-            config = {
-                "mcpServers": {
-                    "craft": {
-                        "command": "uv",
-                        "args": ["run", "python", "craft_tool.py"]
-                    }
-                }
-            }
-
-            # Create MCP client
-            self.client = MCPClient.from_dict(config)
-
-            # Create LLM
-            llm = ChatOllama(model=self.model_name, temperature=0.3)
+            # Get the MCP client (its session is started on first use)
+            if self.shared_client:
+                self.client = await get_shared_client()
+            else:
+                self.client = MCPClient.from_dict(MCP_CONFIG)
+            self._owns_client = not self.shared_client
+
+            # Create LLM (over the process-wide Ollama connection pool)
+            transport = await get_ollama_transport()
+            llm = ChatOllama(
+                model=self.model_name,
+                temperature=0.3,
+                keep_alive=OLLAMA_KEEP_ALIVE,
+                async_client_kwargs={"transport": transport}
+            )
 
             # Create agent with the client
             self.agent = MCPAgent(
                 llm=llm,
                 client=self.client,
                 max_steps=10,
+                system_prompt_template=CRAFT_SYSTEM_PROMPT_TEMPLATE,
                 verbose=True
             )
 
@@ -87,7 +108,7 @@ class CraftAssistant:
             return True
 
         except Exception as e:
-            logger.error(f"Setup failed: {e}")
+            logger.error("Setup failed: %s", e)
             print(f"\nSetup Error: {e}")
             print("Make sure:")
             print("1. Ollama is running with the specified model")
@@ -110,24 +131,32 @@ class CraftAssistant:
             return "Error: Assistant not properly initialized. Please run setup() first."
 
         try:
-            logger.info(f"Processing query: {user_input}")
+            logger.info("Processing query: %s", user_input)
+
+            cache_key = response_cache.key(self.model_name, self.agent, user_input)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Answered from the response cache")
+                record_cached_answer(self.agent, user_input, cached)
+                return cached
 
             # Run the agent with the user input
             result = await self.agent.run(user_input)
+            response_cache.put(cache_key, result)
 
             return result
 
         except Exception as e:
-            logger.error(f"Chat processing failed: {e}")
+            logger.error("Chat processing failed: %s", e)
             return f"Sorry, I encountered an error: {str(e)}"
 
     async def cleanup(self):
-        """Clean up resources."""
-        if self.client:
+        """Clean up resources (the shared client is closed by close_shared_client())."""
+        if self.client and self._owns_client:
             try:
                 await self.client.close_all_sessions()
             except Exception as e:
-                logger.error(f"Cleanup error: {e}")
+                logger.error("Cleanup error: %s", e)
 
     async def interactive_session(self):
         """Run an interactive chat session with the craft assistant."""
@@ -138,7 +167,7 @@ class CraftAssistant:
         try:
             while True:
                 try:
-                    user_input = input("You: ").strip()
+                    user_input = (await ainput("You: ")).strip()
 
                     if user_input.lower() in ['quit', 'exit', 'bye', 'q']:
                         print("\n👋 Happy crafting! Goodbye!")
@@ -147,11 +176,12 @@ class CraftAssistant:
                     if not user_input:
                         continue
 
-                    print("🤔 Assistant is thinking...")
+                    print("Assistant is thinking...")
                     response = await self.chat(user_input)
-                    print(f"\n🎨 Assistant: {response}\n")
+                    print(f"\nAssistant: {response}\n")
 
-                except KeyboardInterrupt:
+                except (KeyboardInterrupt, asyncio.CancelledError):
+                    # Ctrl+C arrives as a cancellation while awaiting input
                     print("\n\n👋 Session interrupted. Goodbye!")
                     break
                 except Exception as e:
@@ -164,11 +194,6 @@ class CraftAssistant:
 async def demo_queries():
     """Demonstrate various craft assistant capabilities with sample queries."""
 
-    assistant = CraftAssistant()
-
-    if not await assistant.setup():
-        return
-
     # Sample queries to demonstrate capabilities
     demo_questions = [
         "List all available craft items",
@@ -180,29 +205,45 @@ async def demo_queries():
         "How do I make an origami crane?"
     ]
 
+    # One assistant per question so agent conversation memory stays separate
+    # while the questions run concurrently; they all share the MCP client
+    assistants = [CraftAssistant() for _ in demo_questions]
+
+    if not await assistants[0].setup():
+        return
+    for assistant in assistants[1:]:
+        await assistant.setup()
+
     print("\n🎨 MCP Craft Assistant Demo 🎨")
     print("=" * 50)
 
-    try:
-        for i, question in enumerate(demo_questions, 1):
-            print(f"\n{i}. Question: {question}")
-            print("-" * 40)
+    semaphore = asyncio.Semaphore(DEMO_CONCURRENCY)
 
+    async def ask(assistant: CraftAssistant, question: str) -> str:
+        async with semaphore:
             try:
                 response = await assistant.chat(question)
-                print(f"Answer: {response}")
-
+                return f"Answer: {response}"
             except Exception as e:
-                print(f"Error: {e}")
+                return f"Error: {e}"
 
-            # Small delay between questions
-            await asyncio.sleep(1)
+    try:
+        answers = await asyncio.gather(
+            *(ask(assistant, question)
+              for assistant, question in zip(assistants, demo_questions))
+        )
+
+        for i, (question, answer) in enumerate(zip(demo_questions, answers), 1):
+            print(f"\n{i}. Question: {question}")
+            print("-" * 40)
+            print(answer)
 
         print("\n" + "=" * 50)
         print("Demo completed! Try the interactive session for more exploration.")
 
     finally:
-        await assistant.cleanup()
+        for assistant in assistants:
+            await assistant.cleanup()
 
 
 async def main():
@@ -235,7 +276,12 @@ async def main():
         print("\n\nExiting...")
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -16,7 +16,10 @@ Prerequisites:
 """
 
 import asyncio
+import functools
 import logging
+import os
+import sys
 from typing import Dict, List, Any, Optional, TypedDict, Annotated
 
 try:
@@ -30,7 +33,8 @@ except ImportError:
 
 try:
     from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
-    from langchain_core.callbacks import BaseCallbackHandler
+    from langchain_core.callbacks import AsyncCallbackHandler
+    from langchain_core.runnables import RunnableConfig
 except ImportError:
     print("❌ langchain-core not found. Install with: uv add langchain-core")
     exit(1)
@@ -47,71 +51,147 @@ except ImportError:
     print("❌ mcp-use not found. Install with: uv add mcp-use")
     exit(1)
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    # Optional faster event loop (not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from craft_client import (
+    CRAFT_SYSTEM_PROMPT_TEMPLATE,
+    DEMO_CONCURRENCY,
+    MCP_CONFIG,
+    OLLAMA_KEEP_ALIVE,
+    MCPClientPool,
+    ainput,
+    configure_logging,
+    get_ollama_transport,
+    record_cached_answer,
+    response_cache,
+)
+
+configure_logging()
 logger = logging.getLogger(__name__)
 
+# Set CRAFT_PREWARM=1 to prefill Ollama's prompt cache with the next turn's
+# prefix while the user is typing (costs an extra model call per turn)
+PREWARM = os.environ.get("CRAFT_PREWARM", "").strip().lower() not in ("", "0", "false", "no")
+
+# Up to one craft_tool.py server per concurrent demo scenario, so their
+# tool calls do not queue behind a single stdio pipe
+MCP_POOL_SIZE = DEMO_CONCURRENCY
+
+# MCP clients shared by every agent in the process, so later sessions skip
+# the server cold start
+_client_pool = MCPClientPool(MCP_CONFIG, MCP_POOL_SIZE)
+
 
 class ConversationState(TypedDict):
     """Simple conversation state for LangGraph."""
     messages: Annotated[List[BaseMessage], add_messages]
 
 
-class StreamingHandler(BaseCallbackHandler):
-    """Handler for streaming LLM tokens."""
+class StreamingHandler(AsyncCallbackHandler):
+    """Handler that queues streamed LLM tokens for an async consumer."""
 
     def __init__(self):
-        self.stream_callback = None
+        self.queue: Optional[asyncio.Queue] = None
+
+    async def on_llm_new_token(self, token: str, **kwargs):
+        if self.queue is not None:
+            await self.queue.put(token)
+
+
+class RequestRecorder(AsyncCallbackHandler):
+    """Handler that keeps the messages and tools of the latest chat model request."""
+
+    def __init__(self):
+        self.messages: List[BaseMessage] = []
+        self.tools: Optional[List[Dict[str, Any]]] = None
+
+    async def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.messages = messages[0]
+        self.tools = (kwargs.get("invocation_params") or {}).get("tools")
+
+
+async def _agent_conversation_node(state: ConversationState, config: RunnableConfig):
+    """Graph node that hands the turn to the agent passed in the run config."""
+    return await config["configurable"]["agent"]._conversation_node(state)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_compiled_graph():
+    """Build and compile the LangGraph conversation flow once per process."""
 
-    def set_callback(self, callback):
-        self.stream_callback = callback
+    # Create state graph
+    workflow = StateGraph(ConversationState)
 
-    def on_llm_new_token(self, token: str, **kwargs):
-        if self.stream_callback:
-            self.stream_callback(token)
+    # Add conversation node
+    workflow.add_node("conversation", _agent_conversation_node)
+
+    # Add edges
+    workflow.add_edge(START, "conversation")
+    workflow.add_edge("conversation", END)
+
+    logger.info("LangGraph workflow compiled")
+    return workflow.compile()
 
 
 class LangGraphCraftAgent:
     """LangGraph agent with FastMCP craft tools."""
 
-    def __init__(self, model_name: str = "llama3.2"):
+    def __init__(self, model_name: str = "llama3.2", shared_client: bool = True,
+                 prewarm: bool = PREWARM):
         self.model_name = model_name
+        self.shared_client = shared_client
+        self.prewarm_enabled = prewarm
+        self._owns_client = False
         self.mcp_agent = None
         self.llm = None
+        self.warm_llm = None
         self.graph_app = None
         self.checkpointer = MemorySaver()
         self.streaming_handler = StreamingHandler()
+        self.request_recorder = RequestRecorder()
 
     async def initialize(self) -> bool:
         """Initialize the agent with MCP integration."""
         try:
             logger.info("Initializing LangGraph Craft Agent...")
 
-            # Set up MCP configuration for FastMCP craft server
-            mcp_config = {
-                "mcpServers": {
-                    "craft": {
-                        "command": "uv",
-                        "args": ["run", "python", "craft_tool.py"]
-                    }
-                }
-            }
-
-            # Create MCP client and agent
-            mcp_client = MCPClient.from_dict(mcp_config)
+            # Get an MCP client (pooled across agents unless shared_client=False)
+            if self.shared_client:
+                mcp_client = await _client_pool.next()
+            else:
+                mcp_client = MCPClient.from_dict(MCP_CONFIG)
+            self._owns_client = not self.shared_client
 
-            # Initialize LLM with streaming support
+            # Initialize LLM with streaming support (over the process-wide
+            # Ollama connection pool)
+            transport = await get_ollama_transport()
             self.llm = ChatOllama(
                 model=self.model_name,
                 temperature=0.3,
-                callbacks=[self.streaming_handler]
+                keep_alive=OLLAMA_KEEP_ALIVE,
+                async_client_kwargs={"transport": transport},
+                callbacks=[self.streaming_handler, self.request_recorder]
             )
+            if self.prewarm_enabled:
+                # Generates a single token and stays off the streaming handler
+                self.warm_llm = ChatOllama(
+                    model=self.model_name,
+                    temperature=0.3,
+                    num_predict=1,
+                    keep_alive=OLLAMA_KEEP_ALIVE,
+                    async_client_kwargs={"transport": transport}
+                )
 
             # Create MCP agent
             self.mcp_agent = MCPAgent(
                 llm=self.llm,
                 client=mcp_client,
                 max_steps=10,
+                system_prompt_template=CRAFT_SYSTEM_PROMPT_TEMPLATE,
                 verbose=True
             )
 
@@ -122,38 +202,25 @@ class LangGraphCraftAgent:
             return True
 
         except Exception as e:
-            logger.error(f"❌ Failed to initialize agent: {e}")
+            logger.error("❌ Failed to initialize agent: %s", e)
             return False
 
     async def _build_graph(self):
-        """Build the LangGraph conversation flow."""
-
-        # Create state graph
-        workflow = StateGraph(ConversationState)
-
-        # Add conversation node
-        workflow.add_node("conversation", self._conversation_node)
-
-        # Add edges
-        workflow.add_edge(START, "conversation")
-        workflow.add_edge("conversation", END)
+        """Bind the shared compiled conversation graph to this agent's memory."""
 
-        # Compile with memory
-        self.graph_app = workflow.compile(checkpointer=self.checkpointer)
-
-        logger.info("LangGraph workflow compiled")
+        # Copying the compiled graph is cheap; only the checkpointer differs
+        self.graph_app = _get_compiled_graph().copy(
+            update={"checkpointer": self.checkpointer})
 
     async def _conversation_node(self, state: ConversationState):
         """Main conversation node that uses MCP agent."""
 
-        # Get the latest human message
-        human_messages = [msg for msg in state["messages"]
-                          if isinstance(msg, HumanMessage)]
-        if not human_messages:
+        # Get the latest human message (add_messages appends, so scan from the end)
+        latest_message = next((msg.content for msg in reversed(state["messages"])
+                               if isinstance(msg, HumanMessage)), None)
+        if latest_message is None:
             return {"messages": []}
 
-        latest_message = human_messages[-1].content
-
         # Use MCP agent to process the message
         try:
             if self.mcp_agent is None:
@@ -163,8 +230,15 @@ class LangGraphCraftAgent:
             message_text = str(latest_message) if not isinstance(
                 latest_message, str) else latest_message
 
-            response = await self.mcp_agent.run(message_text)
-            return {"messages": [AIMessage(content=str(response))]}
+            cache_key = response_cache.key(self.model_name, self.mcp_agent, message_text)
+            response = response_cache.get(cache_key)
+            if response is None:
+                response = str(await self.mcp_agent.run(message_text))
+                response_cache.put(cache_key, response)
+            else:
+                logger.info("Answered from the response cache")
+                record_cached_answer(self.mcp_agent, message_text, response)
+            return {"messages": [AIMessage(content=response)]}
         except Exception as e:
             error_msg = f"Sorry, I encountered an error: {str(e)}"
             return {"messages": [AIMessage(content=error_msg)]}
@@ -176,21 +250,44 @@ class LangGraphCraftAgent:
         Args:
             message: User's message
             thread_id: Thread ID for conversation persistence
-            stream_callback: Optional callback for streaming tokens
+            stream_callback: Optional async callback awaited with each streamed token
 
         Returns:
             AI response
         """
 
-        if stream_callback:
-            self.streaming_handler.set_callback(stream_callback)
-
         if not self.graph_app:
             return "Agent not initialized"
 
-        config = {"configurable": {"thread_id": thread_id}}
+        # The shared graph finds this agent through the run config
+        config = {"configurable": {"thread_id": thread_id, "agent": self}}
 
-        # Process through LangGraph
+        if not stream_callback:
+            return await self._invoke(message, config)
+
+        # Run the graph in a task and hand tokens to the callback as the LLM
+        # produces them; None marks the end of the stream
+        queue = asyncio.Queue()
+        self.streaming_handler.queue = queue
+        task = asyncio.create_task(self._invoke(message, config))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        streamed = False
+        try:
+            while (token := await queue.get()) is not None:
+                streamed = True
+                await stream_callback(token)
+        finally:
+            self.streaming_handler.queue = None
+            if not task.done():
+                task.cancel()
+        response = await task
+        if not streamed:
+            # Cached answers and errors arrive without any streamed tokens
+            await stream_callback(response)
+        return response
+
+    async def _invoke(self, message: str, config: Dict[str, Any]) -> str:
+        """Run one message through the graph and return the AI response."""
         try:
             result = await self.graph_app.ainvoke(
                 {"messages": [HumanMessage(content=message)]},
@@ -198,24 +295,48 @@ class LangGraphCraftAgent:
             )
 
             # Extract AI response
-            ai_messages = [msg for msg in result["messages"]
-                           if isinstance(msg, AIMessage)]
-            if ai_messages:
-                return ai_messages[-1].content
+            ai_message = next((msg for msg in reversed(result["messages"])
+                               if isinstance(msg, AIMessage)), None)
+            if ai_message:
+                return ai_message.content
             else:
                 return "No response generated"
 
         except Exception as e:
-            logger.error(f"Chat error: {e}")
+            logger.error("Chat error: %s", e)
             return f"Error processing message: {str(e)}"
 
+    async def prewarm(self):
+        """Prefill Ollama's KV cache with the prompt prefix of the agent's next turn.
+
+        The next request starts with the rendered system message and the
+        conversation so far, and carries the same tools, so those are taken
+        from the agent's last recorded request. Nothing is sent before the
+        agent's first request.
+        """
+        if self.warm_llm is None or self.mcp_agent is None:
+            return
+        request = self.request_recorder.messages
+        if not request:
+            return
+        try:
+            history = [msg for msg in self.mcp_agent.get_conversation_history()
+                       if isinstance(msg, (HumanMessage, AIMessage))]
+            tools = self.request_recorder.tools
+            llm = self.warm_llm.bind(tools=tools) if tools else self.warm_llm
+            await llm.ainvoke([request[0], *history])
+        except Exception as e:
+            logger.warning("Prewarm failed: %s", e)
+
     async def cleanup(self):
-        """Clean up resources."""
+        """Clean up resources (pooled clients are closed by _client_pool.close_all_sessions())."""
+        if not self._owns_client:
+            return
         if self.mcp_agent and hasattr(self.mcp_agent, 'client') and self.mcp_agent.client:
             try:
                 await self.mcp_agent.client.close_all_sessions()
             except Exception as e:
-                logger.error(f"Cleanup error: {e}")
+                logger.error("Cleanup error: %s", e)
 
 
 class InteractiveCraftChat:
@@ -239,9 +360,34 @@ class InteractiveCraftChat:
 
         thread_id = f"session_{asyncio.get_event_loop().time()}"
 
+        prewarm_task = None
         try:
+            # Streamed tokens go straight to the byte buffer, skipping print();
+            # a stdout without one (e.g. a StringIO) gets text writes instead
+            token_out = getattr(sys.stdout, "buffer", None)
+            if token_out is not None:
+                token_encoding = sys.stdout.encoding or "utf-8"
+
+                def write_token(token):
+                    token_out.write(token.encode(token_encoding, "replace"))
+            else:
+                token_out = sys.stdout
+                write_token = token_out.write
+
+            # Flush each token so it shows up as soon as it arrives
+            async def stream_token(token):
+                write_token(token)
+                token_out.flush()
+
             while True:
-                user_input = input("You: ").strip()
+                # Warm the model while the user types; real input cancels it
+                if self.agent.prewarm_enabled:
+                    prewarm_task = asyncio.create_task(self.agent.prewarm())
+                try:
+                    user_input = (await ainput("You: ")).strip()
+                finally:
+                    if prewarm_task:
+                        prewarm_task.cancel()
 
                 if user_input.lower() in ['quit', 'exit', 'bye']:
                     print("👋 Happy crafting!")
@@ -250,12 +396,9 @@ class InteractiveCraftChat:
                 if not user_input:
                     continue
 
-                print("🤖 Assistant: ", end="", flush=True)
+                print("Assistant: ", end="", flush=True)
 
                 # Stream the response
-                def stream_token(token):
-                    print(token, end="", flush=True)
-
                 response = await self.agent.chat(
                     user_input,
                     thread_id=thread_id,
@@ -264,7 +407,8 @@ class InteractiveCraftChat:
 
                 print("\n")  # New line after response
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Ctrl+C arrives as a cancellation while awaiting input
             print("\n\n👋 Chat interrupted. Goodbye!")
         except Exception as e:
             print(f"\nError: {e}")
@@ -275,15 +419,6 @@ class InteractiveCraftChat:
 async def demo_scenarios():
     """Run demonstration scenarios."""
 
-    agent = LangGraphCraftAgent()
-
-    if not await agent.initialize():
-        print("❌ Failed to initialize agent")
-        return
-
-    print("\n🎨 LangGraph + FastMCP Demo Scenarios 🎨")
-    print("=" * 50)
-
     scenarios = [
         "Hi! I'm new to crafting. What can I make?",
         "I have paper and scissors. What projects are possible?",
@@ -291,27 +426,42 @@ async def demo_scenarios():
         "Can you give me step-by-step instructions for a paper airplane?"
     ]
 
-    try:
-        for i, scenario in enumerate(scenarios, 1):
-            print(f"\n[Scenario {i}] Human: {scenario}")
-            print(f"[Scenario {i}] Assistant: ", end="", flush=True)
+    # One agent per scenario so agent memory stays separate while the
+    # scenarios run concurrently; the MCP client pool spreads them over
+    # up to MCP_POOL_SIZE servers
+    agents = [LangGraphCraftAgent() for _ in scenarios]
 
-            def demo_stream(token):
-                print(token, end="", flush=True)
+    if not await agents[0].initialize():
+        print("❌ Failed to initialize agent")
+        return
+    for agent in agents[1:]:
+        await agent.initialize()
 
-            response = await agent.chat(
-                scenario,
-                thread_id=f"demo_{i}",
-                stream_callback=demo_stream
-            )
+    print("\n🎨 LangGraph + FastMCP Demo Scenarios 🎨")
+    print("=" * 50)
+
+    semaphore = asyncio.Semaphore(DEMO_CONCURRENCY)
 
-            print()  # New line
-            await asyncio.sleep(1)  # Pause between scenarios
+    async def run_scenario(agent: LangGraphCraftAgent, i: int, scenario: str):
+        async with semaphore:
+            # No token streaming here: concurrent streams would interleave
+            return await agent.chat(scenario, thread_id=f"demo_{i}")
+
+    try:
+        responses = await asyncio.gather(
+            *(run_scenario(agent, i, scenario)
+              for i, (agent, scenario) in enumerate(zip(agents, scenarios), 1))
+        )
+
+        for i, (scenario, response) in enumerate(zip(scenarios, responses), 1):
+            print(f"\n[Scenario {i}] Human: {scenario}")
+            print(f"[Scenario {i}] Assistant: {response}")
 
     except Exception as e:
         print(f"Demo error: {e}")
     finally:
-        await agent.cleanup()
+        for agent in agents:
+            await agent.cleanup()
 
 
 async def main():
@@ -353,7 +503,12 @@ async def main():
         print("\nExiting...")
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        await _client_pool.close_all_sessions()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
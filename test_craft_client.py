@@ -0,0 +1,179 @@
+"""
+Test suite for the shared example client pieces.
+"""
+
+import asyncio
+import pytest
+
+pytest.importorskip("mcp_use")
+pytest.importorskip("langchain_ollama")
+pytest.importorskip("langgraph")
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+import craft_client
+import langchain_mcp_example
+import langgraph_mcp_simple
+from craft_client import ResponseCache
+
+
+class FakeAgent:
+    """Stands in for MCPAgent and counts the runs that would reach Ollama."""
+
+    def __init__(self, memory_enabled=True):
+        self.memory_enabled = memory_enabled
+        self.runs = []
+        self.history = []
+
+    def get_conversation_history(self):
+        return self.history
+
+    def add_to_history(self, message):
+        if self.memory_enabled:
+            self.history.append(message)
+
+    async def run(self, query):
+        # Like MCPAgent, remember the question before answering it
+        self.add_to_history(HumanMessage(content=query))
+        self.runs.append(query)
+        answer = f"answer to {query}"
+        self.add_to_history(AIMessage(content=answer))
+        return answer
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """Give each test its own empty response cache."""
+    cache = ResponseCache()
+    monkeypatch.setattr(craft_client, "response_cache", cache)
+    monkeypatch.setattr(langchain_mcp_example, "response_cache", cache)
+    monkeypatch.setattr(langgraph_mcp_simple, "response_cache", cache)
+    return cache
+
+
+class TestResponseCache:
+    """Test the LRU response cache."""
+
+    def test_get_and_put(self):
+        """Test that answers are keyed by model and question."""
+        cache = ResponseCache()
+        agent = FakeAgent()
+        cache.put(cache.key("llama3.2", agent, "List crafts"), "Paper Airplane")
+
+        assert cache.get(cache.key("llama3.2", agent, "List crafts")) == "Paper Airplane"
+        assert cache.get(cache.key("llama3.1", agent, "List crafts")) is None
+        assert cache.get(cache.key("llama3.2", agent, "Show easy crafts")) is None
+
+    def test_key_includes_conversation(self):
+        """Test that the same question after a different conversation misses."""
+        cache = ResponseCache()
+        cache.put(cache.key("llama3.2", FakeAgent(), "Tell me more"), "More about crafts")
+
+        agent = FakeAgent()
+        asyncio.run(agent.run("Show easy crafts"))
+
+        assert cache.get(cache.key("llama3.2", agent, "Tell me more")) is None
+
+    def test_key_ignores_history_without_memory(self):
+        """Test that an agent without memory is keyed like a first turn."""
+        cache = ResponseCache()
+        agent = FakeAgent(memory_enabled=False)
+        agent.history = [HumanMessage(content="Show easy crafts")]
+
+        assert cache.key("llama3.2", agent, "List crafts") == cache.key("llama3.2", FakeAgent(), "List crafts")
+
+    def test_random_questions_are_not_cached(self):
+        """Test that questions with changing answers get no cache key."""
+        cache = ResponseCache()
+        key = cache.key("llama3.2", FakeAgent(), "Suggest a random craft project")
+        cache.put(key, "Painted Rock")
+
+        assert key is None
+        assert cache.get(key) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest unused answer is dropped when full."""
+        cache = ResponseCache(maxsize=2)
+        cache.put(("llama3.2", (), "a"), "1")
+        cache.put(("llama3.2", (), "b"), "2")
+        cache.get(("llama3.2", (), "a"))
+        cache.put(("llama3.2", (), "c"), "3")
+
+        assert cache.get(("llama3.2", (), "a")) == "1"
+        assert cache.get(("llama3.2", (), "b")) is None
+        assert cache.get(("llama3.2", (), "c")) == "3"
+
+    def test_failed_runs_are_not_cached(self):
+        """Test that an agent error is retried rather than replayed."""
+        cache = ResponseCache()
+        cache.put(("llama3.2", (), "a"), "Agent stopped due to an error: connection refused")
+
+        assert cache.get(("llama3.2", (), "a")) is None
+
+
+class TestRepeatedQueries:
+    """Test that a repeated question only skips the agent when the answer would match."""
+
+    def test_langchain_assistant(self, fresh_cache):
+        """Test the LangChain assistant's chat."""
+        first, second = langchain_mcp_example.CraftAssistant(), langchain_mcp_example.CraftAssistant()
+        first.agent, second.agent = FakeAgent(), FakeAgent()
+
+        answer = asyncio.run(first.chat("List crafts"))
+        cached = asyncio.run(second.chat("List crafts"))
+
+        assert answer == cached == "answer to List crafts"
+        assert second.agent.runs == []
+        # The cached turn still lands in the second agent's memory
+        assert [msg.content for msg in second.agent.history] == ["List crafts", answer]
+
+        # Asked again, each conversation has moved on, so the agent runs
+        asyncio.run(second.chat("List crafts"))
+        assert second.agent.runs == ["List crafts"]
+
+    def test_langgraph_agent(self, fresh_cache):
+        """Test the LangGraph agent's conversation node."""
+        agent = langgraph_mcp_simple.LangGraphCraftAgent()
+        agent.mcp_agent = FakeAgent()
+        asyncio.run(agent._build_graph())
+
+        asyncio.run(agent.chat("List crafts", thread_id="a"))
+        asyncio.run(agent.chat("List crafts", thread_id="b"))
+
+        # The second thread asks after a different conversation, so it misses
+        assert agent.mcp_agent.runs == ["List crafts", "List crafts"]
+
+        other = langgraph_mcp_simple.LangGraphCraftAgent()
+        other.mcp_agent = FakeAgent()
+        asyncio.run(other._build_graph())
+
+        assert asyncio.run(other.chat("List crafts", thread_id="a")) == "answer to List crafts"
+        assert other.mcp_agent.runs == []
+
+    def test_langgraph_random_questions_always_run(self, fresh_cache):
+        """Test that a question with a changing answer runs the agent every time."""
+        agents = [langgraph_mcp_simple.LangGraphCraftAgent() for _ in range(2)]
+        for agent in agents:
+            agent.mcp_agent = FakeAgent()
+            asyncio.run(agent._build_graph())
+            asyncio.run(agent.chat("Suggest a random craft project"))
+
+        assert [agent.mcp_agent.runs for agent in agents] == [["Suggest a random craft project"]] * 2
+
+    def test_langgraph_streams_cached_answer(self, fresh_cache):
+        """Test that a cached answer still reaches the stream callback."""
+        agents = [langgraph_mcp_simple.LangGraphCraftAgent() for _ in range(2)]
+        for agent in agents:
+            agent.mcp_agent = FakeAgent()
+            asyncio.run(agent._build_graph())
+        asyncio.run(agents[0].chat("List crafts"))
+
+        tokens = []
+
+        async def stream_token(token):
+            tokens.append(token)
+
+        asyncio.run(agents[1].chat("List crafts", stream_callback=stream_token))
+
+        assert tokens == ["answer to List crafts"]
+        assert agents[1].mcp_agent.runs == []
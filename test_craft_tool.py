@@ -17,6 +17,7 @@ from craft_tool import (
     get_random_craft,
     search_crafts_by_materials,
     estimate_craft_time,
+    batch_execute,
     # Import the underlying functions for testing
     _list_craft_items,
     _get_craft_details,
@@ -24,7 +25,9 @@ from craft_tool import (
     _search_crafts_by_difficulty,
     _get_random_craft,
     _search_crafts_by_materials,
-    _estimate_craft_time
+    _estimate_craft_time,
+    _batch_execute,
+    _serialize_tool_result
 )
 
 
@@ -99,26 +102,20 @@ class TestCraftToolBasics:
         assert isinstance(result_empty, list)
         assert len(result_empty) == 0
 
-    def test__search_crafts_by_difficulty(self):
+    @pytest.mark.parametrize("difficulty,expected_ids", [
+        ("easy", {"paper_airplane", "painted_rock"}),
+        ("medium", {"origami_crane", "friendship_bracelet"}),
+        ("hard", {"macrame_plant_hanger"}),
+    ])
+    def test__search_crafts_by_difficulty(self, difficulty, expected_ids):
         """Test searching crafts by difficulty level."""
-        # Test easy difficulty
-        result = _search_crafts_by_difficulty("easy")
+        result = _search_crafts_by_difficulty(difficulty)
         assert isinstance(result, list)
-        assert len(result) == 2  # paper_airplane and painted_rock
-        
-        easy_ids = {item["id"] for item in result}
-        assert "paper_airplane" in easy_ids
-        assert "painted_rock" in easy_ids
-        
-        # Test medium difficulty
-        result_medium = _search_crafts_by_difficulty("medium")
-        assert len(result_medium) == 2  # origami_crane and friendship_bracelet
-        
-        # Test hard difficulty
-        result_hard = _search_crafts_by_difficulty("hard")
-        assert len(result_hard) == 1  # macrame_plant_hanger
-        
-        # Test invalid difficulty
+        assert len(result) == len(expected_ids)
+        assert {item["id"] for item in result} == expected_ids
+
+    def test__search_crafts_by_invalid_difficulty(self):
+        """Test searching crafts with an invalid difficulty level."""
         result_invalid = _search_crafts_by_difficulty("impossible")
         assert isinstance(result_invalid, dict)
         assert "error" in result_invalid
@@ -188,6 +185,75 @@ class TestCraftToolBasics:
         assert len(result["invalid_items"]) == 1
         assert "nonexistent" in result["invalid_items"]
 
+    def test_estimate_craft_time_hours(self):
+        """Test that hour-based durations are converted to minutes."""
+        result = _estimate_craft_time(["painted_rock"])
+        assert result["estimated_total_minutes"] == 60
+        
+        result_mixed = _estimate_craft_time(["macrame_plant_hanger", "paper_airplane"])
+        assert result_mixed["estimated_total_minutes"] == 125
+        assert result_mixed["estimated_total_hours"] == 2.08
+
+    def test_batch_execute(self):
+        """Test running several tool calls in one batch."""
+        result = _batch_execute([
+            {"tool": "get_craft_details", "args": {"item_id": "paper_airplane"}},
+            {"tool": "search_crafts_by_difficulty", "args": {"difficulty": "hard"}},
+            {"tool": "list_craft_items"}
+        ])
+        
+        assert isinstance(result, list)
+        assert [call["tool"] for call in result] == [
+            "get_craft_details", "search_crafts_by_difficulty", "list_craft_items"]
+        assert result[0]["result"] == _get_craft_details("paper_airplane")
+        assert result[1]["result"] == _search_crafts_by_difficulty("hard")
+        assert result[2]["result"] == _list_craft_items()
+
+    def test_batch_execute_errors(self):
+        """Test error reporting and stop_on_error in batches."""
+        calls = [
+            {"tool": "unknown_tool"},
+            {"tool": "get_craft_details", "args": {"wrong": "x"}},
+            {"tool": "list_craft_items"}
+        ]
+        result = _batch_execute(calls)
+        assert len(result) == 3
+        assert "error" in result[0]["result"]
+        assert "error" in result[1]["result"]
+        assert isinstance(result[2]["result"], list)
+        
+        result_stopped = _batch_execute(calls, stop_on_error=True)
+        assert len(result_stopped) == 1
+        
+        result_empty = _batch_execute([])
+        assert isinstance(result_empty, dict)
+        assert "error" in result_empty
+
+    def test_batch_execute_rejects_wrong_argument_types(self):
+        """Test that batched args are type-checked before the tool runs."""
+        result = _batch_execute([
+            {"tool": "estimate_craft_time", "args": {"item_ids": "paper_airplane"}},
+            {"tool": "search_crafts_by_materials", "args": {"materials": ["paper", 3]}},
+            {"tool": "get_craft_details", "args": {"item_id": ["paper_airplane"]}},
+            {"tool": "list_craft_items", "args": ["paper_airplane"]},
+            {"tool": "estimate_craft_time", "args": {"item_ids": ["paper_airplane"]}}
+        ])
+        
+        for call in result[:4]:
+            assert "error" in call["result"]
+            assert call["result"]["error"].startswith("Invalid arguments")
+        assert result[4]["result"] == _estimate_craft_time(["paper_airplane"])
+
+    def test_batch_execute_rejects_empty_non_object_args(self):
+        """Test that empty args of the wrong type are not treated as no args."""
+        result = _batch_execute([
+            {"tool": "list_craft_items", "args": []},
+            {"tool": "list_craft_items"}
+        ])
+        
+        assert result[0]["result"]["error"].startswith("Invalid arguments")
+        assert result[1]["result"] == _list_craft_items()
+
 
 class TestCraftToolDataIntegrity:
     """Test data integrity and consistency."""
@@ -202,7 +268,7 @@ class TestCraftToolDataIntegrity:
             assert hasattr(item, 'time_required')
             assert hasattr(item, 'category')
             
-            assert isinstance(item.materials, list)
+            assert isinstance(item.materials, tuple)
             assert len(item.materials) > 0
             assert item.difficulty in ['easy', 'medium', 'hard']
 
@@ -222,6 +288,35 @@ class TestCraftToolDataIntegrity:
             assert isinstance(tips, list)
             assert len(tips) > 0
 
+    def test_mutating_results_does_not_change_later_responses(self):
+        """Test that each call returns its own copy of the shared responses."""
+        expected_list = _serialize_tool_result(_list_craft_items())
+        items = _list_craft_items()
+        items[0].clear()
+        items.append({"id": "stale"})
+        assert _serialize_tool_result(_list_craft_items()) == expected_list
+        
+        expected_details = _serialize_tool_result(_get_craft_details("origami_crane"))
+        details = _get_craft_details("origami_crane")
+        details["instructions"].clear()
+        details["item"]["materials"].append("stale")
+        assert _serialize_tool_result(_get_craft_details("origami_crane")) == expected_details
+        
+        for search, query in [
+            (_search_crafts_by_category, "origami"),
+            (_search_crafts_by_difficulty, "easy"),
+            (_search_crafts_by_materials, ["paper"])
+        ]:
+            expected = _serialize_tool_result(search(query))
+            results = search(query)
+            results[0].clear()
+            results.append({"id": "stale"})
+            assert _serialize_tool_result(search(query)) == expected
+        
+        estimate = _estimate_craft_time(["paper_airplane"])
+        estimate["valid_items"][0]["time"] = "stale"
+        assert _estimate_craft_time(["paper_airplane"])["valid_items"][0]["time"] != "stale"
+
 
 class TestCraftToolEdgeCases:
     """Test edge cases and error handling."""
@@ -232,6 +327,14 @@ class TestCraftToolEdgeCases:
         assert isinstance(result, list)
         assert len(result) == 0
 
+    def test_materials_search_normalization(self):
+        """Test that equivalent material queries return the same crafts."""
+        result1 = _search_crafts_by_materials(["paper", "thread"])
+        result2 = _search_crafts_by_materials(["THREAD ", "Paper", "paper"])
+        assert result1 == result2
+        assert [item["id"] for item in result1] == [
+            "paper_airplane", "origami_crane", "friendship_bracelet"]
+
     def test_case_insensitive_searches(self):
         """Test that searches are case insensitive where appropriate."""
         # Category search
@@ -277,12 +380,27 @@ class TestFastMCPIntegration:
             _search_crafts_by_difficulty,
             _get_random_craft,
             _search_crafts_by_materials,
-            _estimate_craft_time
+            _estimate_craft_time,
+            _batch_execute
         ]
         
         for tool in tools:
             assert callable(tool)
 
+    def test_tool_result_serialization(self):
+        """Test that tool results serialize to equivalent JSON text."""
+        # Cached static responses
+        details = _get_craft_details("origami_crane")
+        assert json.loads(_serialize_tool_result(details)) == details
+        items = _list_craft_items()
+        assert json.loads(_serialize_tool_result(items)) == items
+        origami = _search_crafts_by_category("origami")
+        assert json.loads(_serialize_tool_result(origami)) == origami
+        
+        # Freshly built response
+        estimate = _estimate_craft_time(["paper_airplane"])
+        assert json.loads(_serialize_tool_result(estimate)) == estimate
+
 
 if __name__ == "__main__":
     # Run tests with pytest